@@ -9,6 +9,8 @@ from app.models.mcp import MCPActivity
 class ActivityTransformer(BaseTransformer):
     """Transformer for Activity entities between Copper CRM and MCP."""
 
+    __slots__ = ()
+
     def transform(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Transform a Copper activity into MCP format.
         
@@ -213,4 +215,4 @@ class ActivityTransformer(BaseTransformer):
             dt = datetime.fromtimestamp(timestamp, timezone.utc)
         else:
             dt = timestamp
-        return dt.strftime("%Y-%m-%dT%H:%M:%SZ") 
\ No newline at end of file
+        return dt.isoformat(timespec="seconds")[:19] + "Z" 
\ No newline at end of file
@@ -1,6 +1,5 @@
 """Company transformer for converting Copper company data to MCP format."""
-from typing import Dict, Any, List, TypeVar, Union, Optional
-from datetime import datetime, timezone
+from typing import Dict, Any, List, TypeVar, Optional
 from pydantic import HttpUrl
 
 from app.mapping.transform import BaseTransformer
@@ -10,6 +9,8 @@ from app.models.mcp import MCPCompany
 class CompanyTransformer(BaseTransformer):
     """Transform Company data between Copper and MCP formats."""
 
+    __slots__ = ()
+
     def __init__(self, copper_model: type[Company], mcp_model: type[MCPCompany]):
         """Initialize the transformer with models."""
         super().__init__(copper_model, mcp_model)
@@ -165,30 +166,4 @@ class CompanyTransformer(BaseTransformer):
         Returns:
             Primary contact object or None if no contacts
         """
-        if not contacts:
-            return None
-            
-        # First try to find a work contact
-        work_contacts = [c for c in contacts if c.category == preferred_category]
-        if work_contacts:
-            return work_contacts[0]
-            
-        # If no work contact, return the first one
-        return contacts[0]
-
-    def _format_datetime(self, dt: Optional[Union[datetime, int]]) -> Optional[str]:
-        """Format a datetime or Unix timestamp to ISO8601 format with UTC timezone.
-        
-        Args:
-            dt: Either a datetime object or Unix timestamp (int)
-            
-        Returns:
-            ISO8601 formatted string or None if input is None
-        """
-        if dt is None:
-            return None
-            
-        if isinstance(dt, int):
-            dt = datetime.fromtimestamp(dt, timezone.utc)
-            
-        return dt.strftime("%Y-%m-%dT%H:%M:%SZ") 
\ No newline at end of file
+        return self._first_preferred(contacts, preferred_category)
@@ -9,6 +9,8 @@ from app.models.mcp import MCPOpportunity
 class OpportunityTransformer(BaseTransformer):
     """Transform Opportunity data between Copper and MCP formats."""
 
+    __slots__ = ()
+
     def __init__(self, copper_model: type[Opportunity], mcp_model: type[MCPOpportunity]):
         """Initialize the transformer with models."""
         super().__init__(copper_model, mcp_model)
@@ -9,6 +9,8 @@ from app.models.mcp import MCPPerson
 class PersonTransformer(BaseTransformer):
     """Transform Person data between Copper and MCP formats."""
 
+    __slots__ = ()
+
     def __init__(self, copper_model: type[Person], mcp_model: type[MCPPerson]):
         """Initialize the transformer with models."""
         super().__init__(copper_model, mcp_model)
@@ -143,16 +145,7 @@ class PersonTransformer(BaseTransformer):
         Returns:
             Primary contact object or None if no contacts
         """
-        if not contacts:
-            return None
-            
-        # First try to find a work contact
-        work_contacts = [c for c in contacts if c.category == preferred_category]
-        if work_contacts:
-            return work_contacts[0]
-            
-        # If no work contact, return the first one
-        return contacts[0]
+        return self._first_preferred(contacts, preferred_category)
 
     def from_copper(self, data: Dict[Any, Any]) -> Person:
         """Transform Copper data to Person model."""
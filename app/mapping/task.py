@@ -10,6 +10,8 @@ from app.mapping.transform import BaseTransformer
 class TaskTransformer(BaseTransformer):
     """Transform Task data between Copper and MCP formats."""
 
+    __slots__ = ()
+
     def __init__(self, copper_model: type[Task], mcp_model: type[MCPTask]):
         """Initialize the transformer with models."""
         super().__init__(copper_model, mcp_model)
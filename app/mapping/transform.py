@@ -3,59 +3,115 @@
 This module provides the base transformation logic and utilities for converting
 Copper CRM data into MCP (Model Context Protocol) format.
 """
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, TypeVar, Generic, Type, Union
 from datetime import datetime, timezone
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from app.models.mcp import MCPBase, MCPAttributes, MCPMeta, MCPRelationship
 
 CopperT = TypeVar("CopperT", bound=BaseModel)
 MCPT = TypeVar("MCPT", bound=MCPBase)
 
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """Return the list validator for a model, built once per model class.
+    
+    Building a TypeAdapter compiles a new core schema, so it is shared by
+    every transformer instance for the same model instead of being rebuilt
+    whenever a transformer is created.
+    """
+    return TypeAdapter(List[model])
+
 class BaseTransformer(Generic[CopperT, MCPT]):
     """Base transformer for converting between Copper and MCP data formats."""
     
+    __slots__ = (
+        "copper_model",
+        "mcp_model",
+        "entity_type",
+        "_copper_validator",
+        "_mcp_validator",
+    )
+    
     def __init__(self, copper_model: type[CopperT], mcp_model: type[MCPT]):
         """Initialize the transformer with model types."""
         self.copper_model = copper_model
         self.mcp_model = mcp_model
         self.entity_type = mcp_model.model_fields["type"].default
+        # Compiled pydantic-core validators, looked up once instead of going
+        # through model_validate's Python wrapper on every record
+        self._copper_validator = copper_model.__pydantic_validator__
+        self._mcp_validator = mcp_model.__pydantic_validator__
     
-    def to_mcp(self, data: Union[Dict[str, Any], CopperT]) -> Dict[str, Any]:
-        """Transform Copper data to MCP format."""
+    def to_mcp(self, data: Union[Dict[str, Any], str, bytes, CopperT], validate: bool = True) -> Dict[str, Any]:
+        """Transform Copper data to MCP format.
+        
+        Args:
+            data: Copper data as a dict, raw JSON (str or bytes) or model
+                instance. Raw JSON is parsed and validated in one step by
+                pydantic-core, skipping the intermediate Python dict.
+            validate: Validate dict input against the Copper model. Pass False
+                only for trusted data that already has the model's field types;
+                the model is then built with model_construct, which skips
+                validation and type coercion.
+                
+        Returns:
+            Dict[str, Any]: The MCP formatted data
+        """
         # If data is already a model instance, use it directly
         if isinstance(data, self.copper_model):
             validated_data = data
+        elif isinstance(data, (str, bytes)):
+            validated_data = self._copper_validator.validate_json(data)
+        elif validate:
+            validated_data = self._copper_validator.validate_python(data)
         else:
-            validated_data = self.copper_model.model_validate(data)
+            validated_data = self.copper_model.model_construct(**data)
             
-        mcp_data = self._to_mcp_format(validated_data)
+        return self._build_mcp(validated_data)
+    
+    def to_mcp_batch(self, data_list: List[Union[Dict[str, Any], CopperT]]) -> List[Dict[str, Any]]:
+        """Transform a list of Copper records to MCP format.
         
-        # Add standard MCP fields if not already present
-        if "type" not in mcp_data:
-            mcp_data["type"] = self.entity_type
+        The whole list is validated in a single pydantic-core call, so a
+        batch pays the per-call validation overhead once rather than per item.
+        
+        Args:
+            data_list: Copper records as dicts or model instances
+            
+        Returns:
+            List[Dict[str, Any]]: The MCP formatted records, in input order
             
-        # Ensure attributes field exists
-        if "attributes" not in mcp_data:
-            mcp_data["attributes"] = {}
+        Raises:
+            ValidationError: If any record fails validation
+        """
+        build_mcp = self._build_mcp
+        return [build_mcp(item) for item in _list_adapter(self.copper_model).validate_python(data_list)]
+    
+    def _build_mcp(self, validated_data: CopperT) -> Dict[str, Any]:
+        """Build the MCP dict for an already validated Copper record."""
+        mcp_data = self._to_mcp_format(validated_data)
+        
+        # Fill in the standard MCP fields in place rather than merging in a
+        # freshly built dict
+        mcp_data.setdefault("type", self.entity_type)
+        attributes = mcp_data.setdefault("attributes", {})
             
         # Add timestamps if available
         if hasattr(validated_data, "date_created"):
-            mcp_data["attributes"]["created_at"] = self._format_datetime(validated_data.date_created)
+            attributes["created_at"] = self._format_datetime(validated_data.date_created)
             
         if hasattr(validated_data, "date_modified"):
-            mcp_data["attributes"]["updated_at"] = self._format_datetime(validated_data.date_modified)
+            attributes["updated_at"] = self._format_datetime(validated_data.date_modified)
             
-        # Add standard MCP fields
-        mcp_data.update({
-            "source": "copper",
-            "source_id": str(validated_data.id),
-            "relationships": mcp_data.get("relationships", {}),
-            "meta": mcp_data.get("meta", {})
-        })
+        mcp_data["source"] = "copper"
+        mcp_data["source_id"] = str(validated_data.id)
+        mcp_data.setdefault("relationships", {})
+        mcp_data.setdefault("meta", {})
         
         # Create MCP model instance
-        mcp_instance = self.mcp_model.model_validate(mcp_data)
+        mcp_instance = self._mcp_validator.validate_python(mcp_data)
         return mcp_instance.model_dump(exclude_none=True)
     
     def _to_mcp_format(self, data: CopperT) -> Dict[str, Any]:
@@ -81,7 +137,10 @@ class BaseTransformer(Generic[CopperT, MCPT]):
         if isinstance(dt, int):
             dt = datetime.fromtimestamp(dt, timezone.utc)
             
-        return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        # Same output as strftime("%Y-%m-%dT%H:%M:%SZ"): isoformat is done in
+        # C, and its first 19 characters are the date and time without any
+        # UTC offset suffix
+        return dt.isoformat(timespec="seconds")[:19] + "Z"
     
     def _get_primary_contact(self, contacts: list) -> Optional[str]:
         """Get the primary contact value from a list of contacts."""
@@ -95,6 +154,21 @@ class BaseTransformer(Generic[CopperT, MCPT]):
                 
         # Fall back to the first contact
         return contacts[0]["value"]
+    
+    def _first_preferred(self, contacts: List[Any], category: str) -> Optional[Any]:
+        """Get the first contact in a category, falling back to the first contact.
+        
+        Args:
+            contacts: Contact objects with a ``category`` attribute
+            category: Category to prefer
+            
+        Returns:
+            The first matching contact, else the first contact, or None if
+            there are no contacts
+        """
+        if not contacts:
+            return None
+        return next((c for c in contacts if c.category == category), contacts[0])
         
     def _create_relationship(
         self, 
@@ -4,12 +4,11 @@ import pytest_asyncio
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.exceptions import ExceptionMiddleware
 import os
-from typing import Generator
-from unittest.mock import AsyncMock, MagicMock
+from typing import AsyncGenerator
 
 from app.copper.client.base import CopperClient
 from app.copper.auth import get_auth_token
@@ -28,8 +27,8 @@ from app.mapping.task import TaskTransformer
 from app.models.copper import Person, Company, Opportunity, Activity, Task
 from app.models.mcp import MCPPerson, MCPCompany, MCPOpportunity, MCPActivity, MCPTask
 
-@pytest_asyncio.fixture
-async def copper_client() -> CopperClient:
+@pytest.fixture
+def copper_client() -> CopperClient:
     """Create a CopperClient instance for testing.
     
     This fixture uses environment variables for authentication:
@@ -48,24 +47,24 @@ async def copper_client() -> CopperClient:
     auth_token = get_auth_token(token, email)
     return CopperClient(auth_token)
 
-@pytest_asyncio.fixture
-async def people_client(copper_client: CopperClient) -> PeopleClient:
+@pytest.fixture
+def people_client(copper_client: CopperClient) -> PeopleClient:
     """Fixture for PeopleClient."""
     return PeopleClient(copper_client)
 
-@pytest_asyncio.fixture
-async def companies_client(copper_client: CopperClient) -> CompaniesClient:
+@pytest.fixture
+def companies_client(copper_client: CopperClient) -> CompaniesClient:
     """Fixture for CompaniesClient."""
     return CompaniesClient(copper_client)
 
-@pytest_asyncio.fixture
-async def activities_client(copper_client: CopperClient) -> ActivitiesClient:
+@pytest.fixture
+def activities_client(copper_client: CopperClient) -> ActivitiesClient:
     """Fixture for ActivitiesClient."""
     return ActivitiesClient(copper_client)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app() -> FastAPI:
-    """Create a fresh FastAPI application for testing.
+    """Create the FastAPI application shared by the test session.
     
     Returns:
         FastAPI: A configured test application
@@ -139,57 +138,21 @@ def app() -> FastAPI:
     
     return app
 
-@pytest.fixture
-def client(app: FastAPI) -> TestClient:
-    """Create a test client for the FastAPI application.
+@pytest_asyncio.fixture(scope="session")
+async def api_client(app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    """Create an async test client shared by the whole test session.
+    
+    Requests go straight to the ASGI app through ``ASGITransport``, so no
+    sync-to-async portal thread is involved as with ``TestClient``.
     
     Args:
         app: The FastAPI application fixture
     
-    Returns:
-        TestClient: A configured test client
+    Yields:
+        AsyncClient: A configured test client
     """
-    return TestClient(app)
-
-@pytest.fixture
-def mock_base_client():
-    """Create a mock base client with async methods."""
-    client = MagicMock()
-    client.get = AsyncMock()
-    client.post = AsyncMock()
-    client.put = AsyncMock()
-    client.delete = AsyncMock()
-    return client
-
-@pytest.fixture
-def mock_copper_client():
-    """Create a mock Copper client for testing."""
-    client = MagicMock()
-    client.get = MagicMock()
-    client.post = MagicMock()
-    client.put = MagicMock()
-    client.delete = MagicMock()
-    return client
-
-@pytest.fixture
-def mock_get(mock_copper_client):
-    """Mock the get method."""
-    return mock_copper_client.get
-
-@pytest.fixture
-def mock_post(mock_copper_client):
-    """Mock the post method."""
-    return mock_copper_client.post
-
-@pytest.fixture
-def mock_put(mock_copper_client):
-    """Mock the put method."""
-    return mock_copper_client.put
-
-@pytest.fixture
-def mock_delete(mock_copper_client):
-    """Mock the delete method."""
-    return mock_copper_client.delete
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
 
 @pytest.fixture
 def person_transformer() -> PersonTransformer:
@@ -16,21 +16,24 @@ from app.copper.models.people import Person
 from app.copper.models.companies import Company
 from app.copper.models.activities import Activity
 
+# These tests talk to the real Copper API
+pytestmark = pytest.mark.enable_socket
+
 
 @pytest.fixture
-async def people_client(copper_client):
+def people_client(copper_client):
     """Fixture for PeopleClient."""
     return PeopleClient(copper_client)
 
 
 @pytest.fixture
-async def companies_client(copper_client):
+def companies_client(copper_client):
     """Fixture for CompaniesClient."""
     return CompaniesClient(copper_client)
 
 
 @pytest.fixture
-async def activities_client(copper_client):
+def activities_client(copper_client):
     """Fixture for ActivitiesClient."""
     return ActivitiesClient(copper_client)
 
@@ -69,7 +72,6 @@ def validate_mcp_format(data: Dict[str, Any]) -> None:
             )
 
 
-@pytest.mark.asyncio
 async def test_person_transformer_with_api_data(people_client):
     """Test PersonTransformer with real API data."""
     # Get a real person from the API
@@ -91,7 +93,6 @@ async def test_person_transformer_with_api_data(people_client):
         assert "@" in result["attributes"]["email"]
 
 
-@pytest.mark.asyncio
 async def test_company_transformer_with_api_data(companies_client):
     """Test CompanyTransformer with real API data."""
     # Get a real company from the API
@@ -112,7 +113,6 @@ async def test_company_transformer_with_api_data(companies_client):
         assert "://" in result["attributes"]["website"]
 
 
-@pytest.mark.asyncio
 async def test_activity_transformer_with_api_data(activities_client):
     """Test ActivityTransformer with real API data."""
     # Get a real activity from the API
@@ -133,7 +133,6 @@ async def test_activity_transformer_with_api_data(activities_client):
     assert result["relationships"]["parent"]["data"]["type"] in ["person", "company", "opportunity"]
 
 
-@pytest.mark.asyncio
 async def test_transformer_error_handling(people_client):
     """Test transformer error handling with invalid data."""
     # Get a real person but corrupt the data
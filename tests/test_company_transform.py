@@ -8,12 +8,16 @@ from app.models.copper import Company as CopperCompany
 from app.models.mcp import MCPCompany
 from app.models.copper import EmailPhone, Social, Address, CustomField
 
+# Test data
+CREATED_TIMESTAMP = int(datetime(2023, 1, 1, tzinfo=timezone.utc).timestamp())
+MODIFIED_TIMESTAMP = int(datetime(2023, 1, 2, tzinfo=timezone.utc).timestamp())
+
 @pytest.fixture
 def transformer():
     """Create a company transformer instance."""
     return CompanyTransformer(CopperCompany, MCPCompany)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_copper_company():
     """Create a mock Copper company with full data."""
     return {
@@ -45,17 +49,21 @@ def mock_copper_company():
         "primary_contact_id": "54321",
         "tags": ["tech", "enterprise"],
         "custom_fields": [
-            {"custom_field_definition_id": "cf_1", "value": "Test Value"}
+            {"custom_field_definition_id": 1, "value": "Test Value"}
         ],
         "interaction_count": 10,
-        "date_created": int(datetime(2023, 1, 1, tzinfo=timezone.utc).timestamp()),
-        "date_modified": int(datetime(2023, 1, 2, tzinfo=timezone.utc).timestamp())
+        "date_created": CREATED_TIMESTAMP,
+        "date_modified": MODIFIED_TIMESTAMP
     }
 
-def test_transform_full_company(transformer, mock_copper_company):
+@pytest.fixture(scope="module")
+def full_company(mock_copper_company):
+    """Validate the mock company once and share it across the module."""
+    return CopperCompany(**mock_copper_company)
+
+def test_transform_full_company(transformer, full_company):
     """Test transformation of a company with all fields populated."""
-    company = CopperCompany(**mock_copper_company)
-    result = transformer._to_mcp_format(company)
+    result = transformer._to_mcp_format(full_company)
     
     assert result["type"] == "company"
     assert result["attributes"]["name"] == "Test Company"
@@ -107,9 +115,7 @@ def test_transform_minimal_company(transformer):
 
 def test_transform_empty_custom_fields(transformer, mock_copper_company):
     """Test transformation of a company with empty custom fields."""
-    company_data = mock_copper_company.copy()
-    company_data["custom_fields"] = []
-    company = CopperCompany(**company_data)
+    company = CopperCompany(**{**mock_copper_company, "custom_fields": []})
     result = transformer._to_mcp_format(company)
     
     assert isinstance(result, dict)
@@ -120,39 +126,37 @@ def test_transform_validation(transformer):
     with pytest.raises(ValueError):
         transformer._to_mcp_format(CopperCompany())
 
-def test_transform_primary_contact_methods(transformer, mock_copper_company):
+def test_transform_primary_contact_methods(transformer, full_company):
     """Test extraction of primary contact methods."""
     # Test work phone priority
-    company = CopperCompany(**mock_copper_company)
-    result = transformer._to_mcp_format(company)
+    result = transformer._to_mcp_format(full_company)
     assert result["attributes"]["phone"] == "123-456-7890"  # Work phone
     
     # Test fallback to first phone when no work phone
-    company_data = mock_copper_company.copy()
-    company_data["phone_numbers"] = [
-        {"phone": "555-555-5555", "category": "mobile"},
-        {"phone": "444-444-4444", "category": "other"}
-    ]
-    company = CopperCompany(**company_data)
+    company = full_company.model_copy(update={
+        "phone_numbers": [
+            EmailPhone(phone="555-555-5555", category="mobile"),
+            EmailPhone(phone="444-444-4444", category="other")
+        ]
+    })
     result = transformer._to_mcp_format(company)
     assert result["attributes"]["phone"] == "555-555-5555"  # First available
 
-def test_transform_reverse(transformer, mock_copper_company):
+def test_transform_reverse(transformer, full_company):
     """Test reverse transformation from MCP to Copper format."""
     # First transform to MCP
-    company = CopperCompany(**mock_copper_company)
-    mcp_data = transformer._to_mcp_format(company)
+    mcp_data = transformer._to_mcp_format(full_company)
     mcp_company = MCPCompany(**mcp_data)
     
     # Then transform back to Copper
     result = transformer._to_copper_format(mcp_company)
     
-    assert result["name"] == mock_copper_company["name"]
-    assert result["email_domain"] == mock_copper_company["email_domain"]
-    assert result["industry"] == mock_copper_company["industry"]
-    assert result["annual_revenue"] == mock_copper_company["annual_revenue"]
-    assert result["employee_count"] == mock_copper_company["employee_count"]
-    assert result["assignee_id"] == int(mock_copper_company["assignee_id"])
-    assert result["primary_contact_id"] == int(mock_copper_company["primary_contact_id"])
+    assert result["name"] == full_company.name
+    assert result["email_domain"] == full_company.email_domain
+    assert result["industry"] == full_company.industry
+    assert result["annual_revenue"] == full_company.annual_revenue
+    assert result["employee_count"] == full_company.employee_count
+    assert result["assignee_id"] == full_company.assignee_id
+    assert result["primary_contact_id"] == full_company.primary_contact_id
     assert isinstance(result["address"], dict)
-    assert result["address"]["street"] == mock_copper_company["address"]["street"] 
\ No newline at end of file
+    assert result["address"]["street"] == full_company.address.street 
\ No newline at end of file
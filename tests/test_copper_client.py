@@ -1,112 +1,130 @@
 """Tests for the Copper API client."""
-import pytest
-from unittest.mock import Mock, patch
-from fastapi import HTTPException
+import asyncio
 
-from app.copper.client.base import CopperClient
+import pytest
 
+from app.copper.client.base import CopperAPIError, CopperClient
 
-@pytest.fixture
-def mock_session():
-    """Create a mock requests.Session."""
-    with patch('aiohttp.ClientSession') as mock:
-        session = Mock()
-        mock.return_value = session
-        yield session
+ENDPOINT_URL = f"{CopperClient.BASE_URL}test/endpoint"
+OK_PAYLOAD = {'data': 'test'}
+ERROR_PAYLOAD = {'message': 'error'}
+ERROR_CASES = pytest.mark.parametrize('status_code', [401, 403, 404, 429, 500])
 
 
-@pytest.fixture
-def client(mock_session):
-    """Create a client with mock session."""
-    return CopperClient(
-        api_user="test@example.com",
-        api_password="test_password",
-        user_id="12345"
-    )
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response with a JSON body."""
+    
+    content_type = "application/json"
+    
+    def __init__(self, status: int, payload):
+        """Initialize the response with a status code and JSON payload."""
+        self.status = status
+        self.reason = "error" if status >= 400 else "OK"
+        self.headers = {}
+        self._payload = payload
+    
+    async def json(self):
+        """Return the JSON payload."""
+        return self._payload
+    
+    async def __aenter__(self) -> '_FakeResponse':
+        """Enter the response context."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit the response context."""
 
 
-@pytest.mark.asyncio
-async def test_get_request_success(client, mock_session):
-    """Test successful GET request."""
-    mock_response = Mock()
-    mock_response.status = 200
-    mock_response.content_type = "application/json"
-    mock_response.json = Mock()
-    mock_response.json.return_value = {'data': 'test'}
-    mock_session.request.return_value.__aenter__.return_value = mock_response
+class _FakeSession:
+    """Stand-in for the client's aiohttp session.
+    
+    Registered responses are keyed by method and URL and answer every
+    matching request, so retried statuses get the same reply each time.
+    Each request is recorded in ``requests``.
+    """
     
-    result = await client.get('test/endpoint', params={'key': 'value'})
+    def __init__(self):
+        """Initialize the session with no responses or requests."""
+        self.responses = {}
+        self.requests = []
     
-    mock_session.request.assert_called_once()
-    assert result == {'data': 'test'}
+    def add(self, method: str, url: str, status: int = 200, payload=OK_PAYLOAD) -> None:
+        """Register the response for a method and URL."""
+        self.responses[(method, url)] = (status, payload)
+    
+    def request(self, method: str, url: str, params=None, json=None) -> _FakeResponse:
+        """Record the request and return its registered response."""
+        self.requests.append((method, url, params, json))
+        return _FakeResponse(*self.responses[(method, url)])
+    
+    async def close(self) -> None:
+        """Nothing to release."""
 
 
-@pytest.mark.asyncio
-async def test_post_request_success(client, mock_session):
-    """Test successful POST request."""
-    mock_response = Mock()
-    mock_response.status = 200
-    mock_response.content_type = "application/json"
-    mock_response.json = Mock()
-    mock_response.json.return_value = {'data': 'test'}
-    mock_session.request.return_value.__aenter__.return_value = mock_response
+@pytest.fixture(scope="module")
+def client():
+    """Create a client shared by the module's tests.
     
-    result = await client.post('test/endpoint', json={'key': 'value'})
-    
-    mock_session.request.assert_called_once()
-    assert result == {'data': 'test'}
+    A short retry delay keeps the retried 429/5xx cases from sleeping
+    for seconds.
+    """
+    return CopperClient(
+        api_user="test@example.com",
+        api_password="test_password",
+        user_id="12345",
+        retry_delay=0.01
+    )
 
 
-@pytest.mark.asyncio
-async def test_put_request_success(client, mock_session):
-    """Test successful PUT request."""
-    mock_response = Mock()
-    mock_response.status = 200
-    mock_response.content_type = "application/json"
-    mock_response.json = Mock()
-    mock_response.json.return_value = {'data': 'test'}
-    mock_session.request.return_value.__aenter__.return_value = mock_response
+@pytest.fixture
+def mock_session(client):
+    """Give the client a fresh fake session for each test."""
+    client.session = _FakeSession()
+    return client.session
+
+
+@pytest.mark.parametrize('verb,kwargs,expected', [
+    ('get', {'params': {'key': 'value'}}, OK_PAYLOAD),
+    ('post', {'json': {'key': 'value'}}, OK_PAYLOAD),
+    ('put', {'json': {'key': 'value'}}, OK_PAYLOAD),
+    # delete() discards the response body
+    ('delete', {}, None),
+])
+async def test_request_success(client, mock_session, verb, kwargs, expected):
+    """Test successful requests for each HTTP verb."""
+    mock_session.add(verb.upper(), ENDPOINT_URL)
     
-    result = await client.put('test/endpoint', json={'key': 'value'})
+    result = await getattr(client, verb)('test/endpoint', **kwargs)
     
-    mock_session.request.assert_called_once()
-    assert result == {'data': 'test'}
+    assert mock_session.requests == [
+        (verb.upper(), ENDPOINT_URL, kwargs.get('params'), kwargs.get('json'))
+    ]
+    assert result == expected
 
 
-@pytest.mark.asyncio
-async def test_delete_request_success(client, mock_session):
-    """Test successful DELETE request."""
-    mock_response = Mock()
-    mock_response.status = 200
-    mock_response.content_type = "application/json"
-    mock_response.json = Mock()
-    mock_response.json.return_value = {'data': 'test'}
-    mock_session.request.return_value.__aenter__.return_value = mock_response
+async def test_all_verbs_concurrently(client, mock_session):
+    """Test concurrent requests for every HTTP verb share one session."""
+    for verb in ('GET', 'POST', 'PUT', 'DELETE'):
+        mock_session.add(verb, ENDPOINT_URL)
     
-    result = await client.delete('test/endpoint')
+    results = await asyncio.gather(
+        client.get('test/endpoint'),
+        client.post('test/endpoint', json={'key': 'value'}),
+        client.put('test/endpoint', json={'key': 'value'}),
+        client.delete('test/endpoint'),
+    )
     
-    mock_session.request.assert_called_once()
-    assert result == {'data': 'test'}
+    # delete() discards the response body and returns None
+    assert results == [OK_PAYLOAD] * 3 + [None]
+    assert len(mock_session.requests) == 4
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize('status_code,expected_code', [
-    (401, 401),
-    (403, 403),
-    (404, 404),
-    (429, 429),
-    (500, 502),
-])
-async def test_error_responses(client, mock_session, status_code, expected_code):
+@ERROR_CASES
+async def test_error_responses(client, mock_session, status_code):
     """Test error response handling."""
-    mock_response = Mock()
-    mock_response.status = status_code
-    mock_response.content_type = "application/json"
-    mock_response.json = Mock()
-    mock_response.json.return_value = {'message': 'error'}
-    mock_session.request.return_value.__aenter__.return_value = mock_response
-    
-    with pytest.raises(CopperAPIError) as exc:
+    mock_session.add('GET', ENDPOINT_URL, status_code, ERROR_PAYLOAD)
+    
+    with pytest.raises(CopperAPIError, match='error') as exc:
         await client.get('test/endpoint')
     
-    assert exc.value.status_code == status_code 
\ No newline at end of file
+    assert exc.value.status_code == status_code
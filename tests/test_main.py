@@ -1,14 +1,14 @@
 """Tests for the main FastAPI application."""
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 
 
-def test_health_check(client: TestClient) -> None:
+async def test_health_check(api_client: AsyncClient) -> None:
     """Test the health check endpoint returns expected response.
     
     Args:
-        client: Test client fixture
+        api_client: Test client fixture
     """
-    response = client.get("/health")
+    response = await api_client.get("/health")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
@@ -16,26 +16,26 @@ def test_health_check(client: TestClient) -> None:
     assert "version" in data
 
 
-def test_http_exception_handler(client: TestClient) -> None:
+async def test_http_exception_handler(api_client: AsyncClient) -> None:
     """Test the HTTP exception handler formats errors correctly.
     
     Args:
-        client: Test client fixture
+        api_client: Test client fixture
     """
-    response = client.get("/test-error")
+    response = await api_client.get("/test-error")
     assert response.status_code == 400
     data = response.json()
     assert data["error"]["code"] == 400
     assert data["error"]["message"] == "Test error"
 
 
-def test_general_exception_handler(client: TestClient) -> None:
+async def test_general_exception_handler(api_client: AsyncClient) -> None:
     """Test the general exception handler handles unexpected errors.
     
     Args:
-        client: Test client fixture
+        api_client: Test client fixture
     """
-    response = client.get("/test-unexpected-error")
+    response = await api_client.get("/test-unexpected-error")
     assert response.status_code == 500
     data = response.json()
     assert data["error"]["code"] == 500
@@ -1,16 +1,86 @@
 """Tests for the Copper People API client."""
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock, call
 
-from app.copper.client.base import CopperClient
 from app.copper.client.people import PeopleClient
-from app.models.copper import Person, PersonCreate, PersonUpdate, EmailPhone, Address, Social, CustomField
+from app.models.copper import Person, PersonCreate, PersonUpdate, EmailPhone, CustomField
+
+# Test data
+MOCK_PERSON = MappingProxyType({
+    "id": 12345,
+    "name": "John Doe",
+    "emails": [
+        {"email": "john@example.com", "category": "work"},
+        {"email": "john.doe@personal.com", "category": "personal"}
+    ],
+    "phone_numbers": [
+        {"phone": "123-456-7890", "category": "work"},
+        {"phone": "098-765-4321", "category": "mobile"}
+    ],
+    "socials": [
+        {"url": "https://linkedin.com/in/johndoe", "category": "linkedin"},
+        {"url": "https://twitter.com/johndoe", "category": "twitter"}
+    ],
+    "websites": ["https://example.com", "https://blog.example.com"],
+    "address": {
+        "street": "123 Main St",
+        "city": "San Francisco",
+        "state": "CA",
+        "postal_code": "94105",
+        "country": "USA"
+    },
+    "assignee_id": 67890,
+    "contact_type_id": 1,
+    "details": "Test person details",
+    "tags": ["test", "mock"],
+    "custom_fields": [
+        {"custom_field_definition_id": 1, "value": "Custom Value 1"},
+        {"custom_field_definition_id": 2, "value": "Custom Value 2"}
+    ]
+})
+
+LISTED_PERSON = {
+    "id": 1,
+    "name": "Test Person",
+    "emails": [{"email": "test@example.com", "category": "work"}],
+    "phone_numbers": [{"phone": "123-456-7890", "category": "work"}],
+    "socials": [],
+    "websites": []
+}
+
+# Known-good request payloads, built without running validation
+PERSON_CREATE = PersonCreate.model_construct(
+    name="John Doe",
+    emails=[EmailPhone.model_construct(email="john@example.com", category="work")]
+)
+PERSON_UPDATE = PersonUpdate.model_construct(name="John Updated")
+CONVERT_DETAILS = {"status": "converted"}
+SEARCH_PARAMS = {"query": "John"}
+RELATED = [{"id": "1", "type": "opportunity"}]
+
+
+def _make_base():
+    """Build a base client double exposing only the HTTP verb methods.
+    
+    spec_set limits the double to the four verbs, so a misspelled method
+    name still fails with AttributeError, without autospec's per-test
+    signature introspection of CopperClient. The verbs are attached to one
+    parent so ``mock_calls`` records every request in order.
+    """
+    base = Mock(spec_set=["get", "post", "put", "delete"])
+    base.get = AsyncMock()
+    base.post = AsyncMock()
+    base.put = AsyncMock()
+    base.delete = AsyncMock()
+    return base
 
 
 @pytest.fixture
 def mock_base_client():
     """Create a mock base client."""
-    return Mock(spec=CopperClient)
+    return _make_base()
 
 
 @pytest.fixture
@@ -19,188 +89,97 @@ def client(mock_base_client):
     return PeopleClient(mock_base_client)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_person():
-    """Create a mock person with all fields."""
-    return {
-        "id": "12345",
-        "name": "John Doe",
-        "emails": [
-            {"email": "john@example.com", "category": "work"},
-            {"email": "john.doe@personal.com", "category": "personal"}
-        ],
-        "phone_numbers": [
-            {"number": "123-456-7890", "category": "work"},
-            {"number": "098-765-4321", "category": "mobile"}
-        ],
-        "socials": [
-            {"url": "https://linkedin.com/in/johndoe", "category": "linkedin"},
-            {"url": "https://twitter.com/johndoe", "category": "twitter"}
-        ],
-        "websites": [
-            {"url": "https://example.com", "category": "work"},
-            {"url": "https://blog.example.com", "category": "blog"}
-        ],
-        "address": {
-            "street": "123 Main St",
-            "city": "San Francisco",
-            "state": "CA",
-            "postal_code": "94105",
-            "country": "USA"
-        },
-        "assignee_id": "67890",
-        "contact_type_id": "1",
-        "details": "Test person details",
-        "tags": ["test", "mock"],
-        "custom_fields": [
-            {"custom_field_definition_id": "1", "value": "Custom Value 1"},
-            {"custom_field_definition_id": "2", "value": "Custom Value 2"}
-        ]
-    }
-
-
-@pytest.mark.asyncio
-async def test_list_people(client, mock_base_client):
-    """Test listing people with pagination."""
-    mock_response = {
-        "items": [
-            {
-                "id": "1",
-                "name": "Test Person",
-                "emails": [{"email": "test@example.com", "category": "work"}],
-                "phone_numbers": [{"number": "123-456-7890", "category": "work"}],
-                "socials": [],
-                "websites": []
-            }
-        ],
-        "total": 1,
-        "page": 1,
-        "page_size": 10
-    }
-    mock_base_client.get.return_value = mock_response
-    
-    result = await client.list(page_size=10, page_number=1)
-    assert len(result) == 1
-    assert isinstance(result[0], Person)
-    assert result[0].id == "1"
-    assert result[0].name == "Test Person"
-    assert result[0].emails[0].email == "test@example.com"
-    mock_base_client.get.assert_called_once_with("/people", params={"page_size": 10, "page": 1})
+    """Create a mock person with all fields, shared read-only by the module."""
+    return MOCK_PERSON
 
 
-@pytest.mark.asyncio
-async def test_get_person(client, mock_base_client, mock_person):
-    """Test getting a person by ID."""
-    mock_base_client.get.return_value = mock_person
+@pytest.fixture
+def mock_person_mut(mock_person):
+    """Create a private copy of the mock person for tests that modify it.
     
-    person = await client.get("12345")
-    assert isinstance(person, Person)
-    assert person.id == "12345"
-    assert person.name == "John Doe"
-    assert len(person.emails) == 2
-    assert person.emails[0].email == "john@example.com"
-    mock_base_client.get.assert_called_once_with("/people/12345")
+    The copy is shallow: tests may replace top-level keys but must not
+    mutate the nested lists, which stay shared with MOCK_PERSON.
+    """
+    return dict(mock_person)
 
 
-@pytest.mark.asyncio
-async def test_create_person(client, mock_base_client, mock_person):
-    """Test creating a new person."""
-    mock_base_client.post.return_value = mock_person
+@pytest.mark.parametrize('method,kwargs,mock_attr,expected_call,item', [
+    ('list', {"page_size": 10, "page_number": 1}, 'get',
+     call.get("people", params={"page_size": 10, "page": 1}), LISTED_PERSON),
+    ('search', {"query": SEARCH_PARAMS}, 'post',
+     call.post("people/search", json=SEARCH_PARAMS), MOCK_PERSON),
+])
+async def test_paged_person_methods(client, mock_base_client, method, kwargs, mock_attr, expected_call, item):
+    """Test methods that return a page of people parse each item into a Person."""
+    # The client parses the response body as a bare list of people
+    getattr(mock_base_client, mock_attr).return_value = [item]
     
-    person_data = PersonCreate(
-        name="John Doe",
-        emails=[EmailPhone(email="john@example.com", category="work")]
-    )
+    result = await getattr(client, method)(**kwargs)
     
-    person = await client.create(person_data)
+    assert len(result) == 1
+    assert isinstance(result[0], Person)
+    assert result[0].id == item["id"]
+    assert result[0].name == item["name"]
+    assert result[0].emails[0].email == item["emails"][0]["email"]
+    assert mock_base_client.mock_calls == [expected_call]
+
+
+@pytest.mark.parametrize('method,args,mock_attr,expected_call', [
+    ('get', (12345,), 'get', call.get("people/12345")),
+    ('create', (PERSON_CREATE,), 'post',
+     call.post("people", json=PERSON_CREATE.model_dump(exclude_none=True))),
+    ('update', (12345, PERSON_UPDATE), 'put',
+     call.put("people/12345", json=PERSON_UPDATE.model_dump(exclude_none=True))),
+    ('convert_lead', (1, CONVERT_DETAILS), 'post', call.post("people/1/convert", json=CONVERT_DETAILS)),
+])
+async def test_single_person_methods(client, mock_base_client, method, args, mock_attr, expected_call):
+    """Test methods that return a single person parse the response into a Person."""
+    getattr(mock_base_client, mock_attr).return_value = MOCK_PERSON
+    
+    person = await getattr(client, method)(*args)
     
     assert isinstance(person, Person)
+    assert person.id == 12345
     assert person.name == "John Doe"
-    mock_base_client.post.assert_called_once_with("/people", person_data.dict(exclude_unset=True))
-
-
-@pytest.mark.asyncio
-async def test_update_person(client, mock_base_client, mock_person):
-    """Test updating an existing person."""
-    mock_base_client.put.return_value = mock_person
-    
-    person_data = PersonUpdate(name="John Updated")
-    
-    person = await client.update("12345", person_data)
-    
-    assert isinstance(person, Person)
-    assert person.id == "12345"
-    mock_base_client.put.assert_called_once_with("/people/12345", person_data.dict(exclude_unset=True))
-
-
-@pytest.mark.asyncio
-async def test_delete_person(client, mock_base_client):
-    """Test deleting a person."""
-    mock_base_client.delete.return_value = None
-    
-    await client.delete("12345")
-    mock_base_client.delete.assert_called_once_with("/people/12345")
-
-
-@pytest.mark.asyncio
-async def test_search_people(client, mock_base_client, mock_person):
-    """Test searching for people."""
-    mock_response = {
-        "items": [mock_person],
-        "total": 1,
-        "page": 1,
-        "page_size": 10
-    }
-    mock_base_client.post.return_value = mock_response
-    
-    search_params = {"query": "John"}
-    
-    results = await client.search(search_params)
-    
-    assert len(results) == 1
-    assert isinstance(results[0], Person)
-    assert results[0].name == "John Doe"
-    mock_base_client.post.assert_called_once_with("/people/search", search_params)
+    assert len(person.emails) == 2
+    assert person.emails[0].email == "john@example.com"
+    assert mock_base_client.mock_calls == [expected_call]
 
 
-@pytest.mark.asyncio
-async def test_update_custom_fields(client, mock_base_client, mock_person):
+async def test_update_custom_fields(client, mock_base_client, mock_person_mut):
     """Test updating custom fields."""
-    custom_fields = [CustomField(custom_field_definition_id="1", value="test")]
-    mock_person["custom_fields"] = [cf.dict() for cf in custom_fields]
-    mock_base_client.put.return_value = mock_person
+    cf_payload = [CustomField(custom_field_definition_id=1, value="test").model_dump()]
+    mock_person_mut["custom_fields"] = cf_payload
+    mock_base_client.put.return_value = mock_person_mut
     
-    result = await client.update_custom_fields("1", custom_fields)
+    result = await client.update_custom_fields(1, cf_payload)
     assert isinstance(result, Person)
-    assert result.id == "12345"
+    assert result.id == 12345
     assert len(result.custom_fields) == 1
-    assert result.custom_fields[0].custom_field_definition_id == "1"
+    assert result.custom_fields[0].custom_field_definition_id == 1
     assert result.custom_fields[0].value == "test"
-    mock_base_client.put.assert_called_once_with("/people/1/custom_fields", {"custom_fields": [cf.dict() for cf in custom_fields]})
+    assert mock_base_client.mock_calls == [
+        call.put("people/1/custom_fields", json={"custom_fields": cf_payload})
+    ]
+    # The client forwards the payload it was given rather than rebuilding it
+    assert mock_base_client.put.call_args.kwargs["json"]["custom_fields"] is cf_payload
 
 
-@pytest.mark.asyncio
-async def test_convert_lead(client, mock_base_client, mock_person):
-    """Test converting a lead to a person."""
-    mock_base_client.post.return_value = mock_person
-    
-    details = {"status": "converted"}
+async def test_delete_person(client, mock_base_client):
+    """Test deleting a person."""
+    mock_base_client.delete.return_value = None
     
-    result = await client.convert_lead("1", details)
-    assert isinstance(result, Person)
-    assert result.id == "12345"
-    assert result.name == "John Doe"
-    mock_base_client.post.assert_called_once_with("/leads/1/convert", details)
+    assert await client.delete(12345) is None
+    assert mock_base_client.mock_calls == [call.delete("people/12345")]
 
 
-@pytest.mark.asyncio
 async def test_get_related(client, mock_base_client):
     """Test getting related entities."""
-    expected = {"items": [{"id": "1", "type": "opportunity"}]}
-    mock_base_client.get.return_value = expected
+    mock_base_client.get.return_value = RELATED
     
-    result = await client.get_related("1")
-    assert len(result) == 1
-    assert result[0]["id"] == "1"
-    assert result[0]["type"] == "opportunity"
-    mock_base_client.get.assert_called_once_with("/people/1/related")
\ No newline at end of file
+    result = await client.get_related(1, "opportunities")
+    
+    assert result == RELATED
+    assert mock_base_client.mock_calls == [call.get("people/1/related/opportunities")]
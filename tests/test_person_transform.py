@@ -1,69 +1,83 @@
 """Tests for the Person transformer."""
+import json
+
 import pytest
 from datetime import datetime, timezone
-from typing import Dict, Any
-from pydantic import HttpUrl
 from pydantic_core import ValidationError
 
 from app.mapping.person import PersonTransformer
-from app.models.copper import Person, Address, EmailPhone, Social, CustomField
+from app.models.copper import Person, EmailPhone
 from app.models.mcp import MCPPerson
 
-@pytest.fixture
+# Test data
+TIMESTAMP = int(datetime.now(timezone.utc).timestamp())
+EMPTY = ()  # Shared immutable stand-in for empty list fields
+TAGS = ("test", "person")
+WEBSITES = ("https://johndoe.com",)
+CUSTOM_FIELDS = ({"custom_field_definition_id": 1, "value": "Custom value 1"},)
+
+# Person fields expected from transformer.from_copper, as JSON-mode dumps
+FROM_COPPER_EXPECTED = {
+    "id": 12345,
+    "name": "John Doe",
+    "emails": [{"category": "work", "email": "john@work.com", "phone": None}],
+    "phone_numbers": [{"category": "work", "email": None, "phone": "+1234567890"}],
+    "socials": [{"category": "linkedin", "url": "https://linkedin.com/johndoe"}],
+    "websites": ["https://johndoe.com"],
+    "address": {
+        "street": "123 Main St",
+        "city": "San Francisco",
+        "state": "CA",
+        "postal_code": "94105",
+        "country": "US"
+    },
+    "assignee_id": 67890,
+    "contact_type_id": 1,
+    "details": "Test person details",
+    "tags": ["test", "person"],
+    "custom_fields": [{"custom_field_definition_id": 1, "value": "Custom value 1"}]
+}
+
+BASE_PERSON = {
+    "id": 123,
+    "name": "John Doe",
+    "emails": [{"email": "john@example.com", "category": "work"}],
+    "details": None,
+    "phone_numbers": EMPTY,
+    "socials": EMPTY,
+    "websites": EMPTY
+}
+
+INVALID_PERSON = {
+    **BASE_PERSON,
+    "name": "",  # Invalid empty name
+    "emails": [{"email": "invalid-email", "category": "work"}]  # Invalid email
+}
+
+FULL_PERSON = {
+    "id": 789,
+    "name": "Jane Smith",
+    "email": "jane@example.com",
+    "details": "Person details",
+    "phone_numbers": [{"number": "123-456-7890"}],
+    "socials": [{"url": "https://linkedin.com/in/janesmith"}],
+    "websites": ["https://janesmith.com"],
+    "date_created": TIMESTAMP,
+    "date_modified": TIMESTAMP,
+    "assignee_id": 101,
+    "custom_fields": [
+        {"custom_field_definition_id": 201, "value": "Custom value"}
+    ]
+}
+
+@pytest.fixture(scope="session")
 def transformer():
     """Create a person transformer for testing."""
     return PersonTransformer(copper_model=Person, mcp_model=MCPPerson)
 
-@pytest.fixture
-def mock_person():
-    """Create a mock person with all fields."""
-    return Person(
-        id=12345,
-        name="John Doe",
-        emails=[
-            EmailPhone(email="john@work.com", category="work"),
-            EmailPhone(email="john@personal.com", category="personal")
-        ],
-        phone_numbers=[
-            EmailPhone(phone="+1234567890", category="work"),
-            EmailPhone(phone="+0987654321", category="mobile")
-        ],
-        socials=[
-            Social(url="https://linkedin.com/johndoe", category="linkedin")
-        ],
-        websites=["https://johndoe.com"],
-        address=Address(
-            street="123 Main St",
-            city="San Francisco",
-            state="CA",
-            postal_code="94105",
-            country="US"
-        ),
-        assignee_id=67890,
-        contact_type_id=1,
-        details="Test person details",
-        tags=["test", "person"],
-        custom_fields=[
-            CustomField(
-                custom_field_definition_id=1,
-                value="Custom value 1"
-            )
-        ]
-    )
-
 def test_transform_minimal_person(transformer):
     """Test transforming a person with minimal data."""
-    data = {
-        "id": 123,
-        "name": "John Doe",
-        "emails": [{"email": "john@example.com", "category": "work"}],
-        "details": None,
-        "phone_numbers": [],
-        "socials": [],
-        "websites": []
-    }
-    
-    result = transformer.to_mcp(data)
+    result = transformer.to_mcp(BASE_PERSON)
     assert result["type"] == "person"
     assert result["source"] == "copper"
     assert result["source_id"] == "123"
@@ -76,26 +90,14 @@ def test_transform_minimal_person(transformer):
     assert result["attributes"]["websites"] == []
     assert result["meta"]["custom_fields"] == {}
 
+def test_transform_from_json(transformer):
+    """Test transforming a person from raw JSON bytes."""
+    raw = json.dumps(BASE_PERSON).encode()
+    assert transformer.to_mcp(raw) == transformer.to_mcp(BASE_PERSON)
+
 def test_transform_full_person(transformer):
     """Test transforming a person with all fields populated."""
-    now = int(datetime.now(timezone.utc).timestamp())
-    data = {
-        "id": 789,
-        "name": "Jane Smith",
-        "email": "jane@example.com",
-        "details": "Person details",
-        "phone_numbers": [{"number": "123-456-7890"}],
-        "socials": [{"url": "https://linkedin.com/in/janesmith"}],
-        "websites": ["https://janesmith.com"],
-        "date_created": now,
-        "date_modified": now,
-        "assignee_id": 101,
-        "custom_fields": [
-            {"custom_field_definition_id": 201, "value": "Custom value"}
-        ]
-    }
-    
-    result = transformer.to_mcp(data)
+    result = transformer.to_mcp(FULL_PERSON)
     assert result["type"] == "person"
     assert result["source"] == "copper"
     assert result["source_id"] == "789"
@@ -109,68 +111,35 @@ def test_transform_full_person(transformer):
 
 def test_transform_validation(transformer):
     """Test validation of person data."""
-    data = {
-        "id": 123,
-        "name": "",  # Invalid empty name
-        "emails": [{"email": "invalid-email", "category": "work"}],  # Invalid email
-        "details": None,
-        "phone_numbers": [],
-        "socials": [],
-        "websites": []
-    }
-
-    with pytest.raises(ValidationError):
-        transformer.to_mcp(data)
+    with pytest.raises(ValidationError, match=r"name|email"):
+        transformer.to_mcp(INVALID_PERSON)
 
 def test_transform_empty_custom_fields(transformer):
     """Test transforming a person with empty custom fields."""
-    data = {
-        "id": 123,
-        "name": "John Doe",
-        "emails": [{"email": "john@example.com", "category": "work"}],
-        "details": None,
-        "phone_numbers": [],
-        "socials": [],
-        "websites": [],
-        "custom_fields": []
-    }
-    
-    result = transformer.to_mcp(data)
+    result = transformer.to_mcp({**BASE_PERSON, "custom_fields": EMPTY})
     assert result["meta"]["custom_fields"] == {}
 
-def test_transform_work_contact_priority():
+def test_transform_work_contact_priority(transformer):
     """Test that work contact details are prioritized."""
-    transformer = PersonTransformer(copper_model=Person, mcp_model=MCPPerson)
-    person = Person(
+    person = Person.model_construct(
         id=123,
         name="John Doe",
         emails=[
-            EmailPhone(email="personal@example.com", category="personal"),
-            EmailPhone(email="work@example.com", category="work")
+            EmailPhone.model_construct(email="personal@example.com", category="personal"),
+            EmailPhone.model_construct(email="work@example.com", category="work")
         ],
         phone_numbers=[
-            EmailPhone(phone="+1234567890", category="mobile"),
-            EmailPhone(phone="+0987654321", category="work")
+            EmailPhone.model_construct(phone="+1234567890", category="mobile"),
+            EmailPhone.model_construct(phone="+0987654321", category="work")
         ]
     )
     result = transformer.to_mcp(person)
     assert result["attributes"]["email"] == "work@example.com"
     assert result["attributes"]["phone"] == "+0987654321"
 
-def test_transform_fallback_to_full_name():
-    """Test fallback to full name when components not provided."""
-    transformer = PersonTransformer(copper_model=Person, mcp_model=MCPPerson)
-    person = Person(
-        id=123,
-        name="John Smith Doe"
-    )
-    result = transformer.to_mcp(person)
-    assert result["attributes"]["first_name"] == "John"
-    assert result["attributes"]["last_name"] == "Smith Doe"
-
 def test_transform_empty_lists(transformer):
     """Test handling of empty contact lists."""
-    person = Person(
+    person = Person.model_construct(
         id=123,
         name="John Doe"
     )
@@ -180,6 +149,16 @@ def test_transform_empty_lists(transformer):
     assert result["attributes"]["socials"] == []
     assert result["attributes"]["websites"] == []
 
+def test_transform_fallback_to_full_name(transformer):
+    """Test fallback to full name when components not provided."""
+    person = Person.model_construct(
+        id=123,
+        name="John Smith Doe"
+    )
+    result = transformer.to_mcp(person)
+    assert result["attributes"]["first_name"] == "John"
+    assert result["attributes"]["last_name"] == "Smith Doe"
+
 def test_transform_from_copper(transformer):
     """Test transforming Copper data to a Person model."""
     copper_data = {
@@ -189,7 +168,7 @@ def test_transform_from_copper(transformer):
             "emails": [{"email": "john@work.com", "category": "work"}],
             "phone_numbers": [{"phone": "+1234567890", "category": "work"}],
             "socials": [{"url": "https://linkedin.com/johndoe", "category": "linkedin"}],
-            "websites": ["https://johndoe.com"],
+            "websites": WEBSITES,
             "address": {
                 "street": "123 Main St",
                 "city": "San Francisco",
@@ -200,55 +179,26 @@ def test_transform_from_copper(transformer):
             "assignee_id": 67890,
             "contact_type_id": 1,
             "details": "Test person details",
-            "tags": ["test", "person"]
+            "tags": TAGS
         },
-        "custom_fields": [
-            {
-                "custom_field_definition_id": 1,
-                "value": "Custom value 1"
-            }
-        ]
+        "custom_fields": CUSTOM_FIELDS
     }
 
     result = transformer.from_copper(copper_data)
-    assert result.id == 12345
-    assert result.name == "John Doe"
-    assert len(result.emails) == 1
-    assert result.emails[0].email == "john@work.com"
-    assert result.emails[0].category == "work"
-    assert len(result.phone_numbers) == 1
-    assert result.phone_numbers[0].phone == "+1234567890"
-    assert result.phone_numbers[0].category == "work"
-    assert len(result.socials) == 1
-    assert str(result.socials[0].url) == "https://linkedin.com/johndoe"
-    assert result.socials[0].category == "linkedin"
-    assert len(result.websites) == 1
-    assert result.websites[0] == "https://johndoe.com"
-    assert result.address.street == "123 Main St"
-    assert result.address.city == "San Francisco"
-    assert result.address.state == "CA"
-    assert result.address.postal_code == "94105"
-    assert result.address.country == "US"
-    assert result.assignee_id == 67890
-    assert result.contact_type_id == 1
-    assert result.details == "Test person details"
-    assert result.tags == ["test", "person"]
-    assert len(result.custom_fields) == 1
-    assert result.custom_fields[0].custom_field_definition_id == 1
-    assert result.custom_fields[0].value == "Custom value 1"
+    assert result.model_dump(mode="json", include=set(FROM_COPPER_EXPECTED)) == FROM_COPPER_EXPECTED
 
 def test_primary_contact_extraction(transformer):
     """Test extraction of primary contact information."""
-    person = Person(
+    person = Person.model_construct(
         id=12345,
         name="John Doe",
         emails=[
-            EmailPhone(email="primary@work.com", category="work"),
-            EmailPhone(email="secondary@personal.com", category="personal")
+            EmailPhone.model_construct(email="primary@work.com", category="work"),
+            EmailPhone.model_construct(email="secondary@personal.com", category="personal")
         ],
         phone_numbers=[
-            EmailPhone(phone="+1234567890", category="work"),
-            EmailPhone(phone="+0987654321", category="mobile")
+            EmailPhone.model_construct(phone="+1234567890", category="work"),
+            EmailPhone.model_construct(phone="+0987654321", category="mobile")
         ]
     )
 
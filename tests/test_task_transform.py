@@ -1,27 +1,35 @@
 """Tests for task data transformation between Copper and MCP formats."""
 import pytest
+import time_machine
 from datetime import datetime, timezone
+from types import MappingProxyType
 from app.models.copper import Task
 from app.models.mcp import MCPTask
 from app.mapping.task import TaskTransformer
 
 # Test data
-NOW = datetime.now(timezone.utc)
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
 TIMESTAMP = int(NOW.timestamp())
 
-@pytest.fixture
+@pytest.fixture(autouse=True, scope="module")
+def _frozen_time():
+    """Stop the clock at NOW so datetime.now() is deterministic in these tests."""
+    with time_machine.travel(NOW, tick=False):
+        yield
+
+@pytest.fixture(scope="session")
 def transformer():
     """Create a task transformer for testing."""
     return TaskTransformer(copper_model=Task, mcp_model=MCPTask)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def copper_task():
-    """Create a sample Copper task for testing."""
-    return {
+    """Create a sample Copper task, shared read-only by the module."""
+    return MappingProxyType({
         "id": 123,
         "name": "Test Task",
         "assignee_id": 456,
-        "due_date": int(datetime.now(timezone.utc).timestamp()),
+        "due_date": TIMESTAMP,
         "reminder_date": None,
         "completed_date": None,
         "priority": "high",
@@ -29,16 +37,17 @@ def copper_task():
         "details": "Test task details",
         "tags": ["test"],
         "custom_fields": [{"id": 1, "value": "custom value"}],
-        "date_created": int(datetime.now(timezone.utc).timestamp()),
-        "date_modified": int(datetime.now(timezone.utc).timestamp())
-    }
+        "date_created": TIMESTAMP,
+        "date_modified": TIMESTAMP
+    })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mcp_task():
-    """Create a sample MCP task for testing."""
-    return {
+    """Create a sample MCP task, shared read-only by the module."""
+    return MappingProxyType({
         "id": "123",
         "type": "task",
+        "name": "Test Task",
         "source": "copper",
         "source_id": "123",
         "attributes": {
@@ -46,25 +55,34 @@ def mcp_task():
             "description": "Test task details",
             "status": "open",
             "priority": "high",
-            "due_date": datetime.now(timezone.utc),
+            "due_date": NOW,
             "assignee": "456",
             "completed_date": None,
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
+            "created_at": NOW,
+            "updated_at": NOW
         },
         "relationships": {},
         "meta": {
             "custom_fields": [{"id": 1, "value": "custom value"}]
         }
-    }
+    })
 
-def test_copper_to_mcp(transformer, copper_task):
-    """Test conversion from Copper to MCP format."""
-    # Convert to Copper model first
-    copper_obj = Task(**copper_task)
+@pytest.fixture(scope="module")
+def copper_task_model(copper_task):
+    """Build the sample Copper task model without re-running validation."""
+    return Task.model_construct(**copper_task)
+
+@pytest.fixture(scope="module")
+def mcp_task_model(mcp_task):
+    """Build the sample MCP task model without re-running validation.
     
-    # Transform to MCP
-    result = transformer.to_mcp(copper_obj)
+    Only valid for payloads that validate as MCPTask, which mcp_task does.
+    """
+    return MCPTask.model_construct(**mcp_task)
+
+def test_copper_to_mcp(transformer, copper_task, copper_task_model):
+    """Test conversion from Copper to MCP format."""
+    result = transformer.to_mcp(copper_task_model)
     
     # Verify core fields
     assert result.id == str(copper_task["id"])
@@ -92,13 +110,9 @@ def test_copper_to_mcp(transformer, copper_task):
     assert result.tags == copper_task["tags"]
     assert result.metadata == copper_task["custom_fields"]
 
-def test_mcp_to_copper(transformer, mcp_task):
+def test_mcp_to_copper(transformer, mcp_task, mcp_task_model):
     """Test conversion from MCP to Copper format."""
-    # Convert to MCP model first
-    mcp_obj = MCPTask(**mcp_task)
-    
-    # Transform to Copper
-    result = transformer.to_copper(mcp_obj)
+    result = transformer.to_copper(mcp_task_model)
     
     # Verify core fields
     assert result["name"] == mcp_task["name"]
@@ -143,23 +157,16 @@ def test_edge_cases(transformer):
     assert "status" in copper_result
     assert "priority" in copper_result
 
-def test_validation(transformer):
+@pytest.mark.parametrize("kwargs,exc", [
+    ({"name": "Test", "priority": "invalid"}, ValueError),  # Invalid priority
+    ({"name": "Test", "status": "invalid"}, ValueError),  # Invalid status
+    ({}, ValueError),  # Missing required field (name)
+    ({"name": "Test", "due_date": "not a timestamp"}, TypeError),  # Invalid date format
+])
+def test_validation(kwargs, exc):
     """Test validation of task data."""
-    # Invalid priority
-    with pytest.raises(ValueError):
-        Task(name="Test", priority="invalid")
-    
-    # Invalid status
-    with pytest.raises(ValueError):
-        Task(name="Test", status="invalid")
-    
-    # Missing required field (name)
-    with pytest.raises(ValueError):
-        Task()
-    
-    # Invalid date format
-    with pytest.raises(TypeError):
-        Task(name="Test", due_date="not a timestamp")
+    with pytest.raises(exc):
+        Task(**kwargs)
 
 def test_datetime_handling(transformer):
     """Test datetime field handling."""
@@ -174,17 +181,14 @@ def test_datetime_handling(transformer):
     assert isinstance(mcp_result.due_date, datetime)
     assert mcp_result.due_date.tzinfo == timezone.utc
 
-def test_related_resource_handling(transformer):
+@pytest.mark.parametrize("entity_type", ["person", "company", "opportunity"])
+def test_related_resource_handling(transformer, entity_type):
     """Test handling of related resources."""
-    # Test with different entity types
-    entity_types = ["person", "company", "opportunity"]
+    copper_task = Task(
+        name="Test",
+        related_resource={"type": entity_type, "id": 123}
+    )
     
-    for entity_type in entity_types:
-        copper_task = Task(
-            name="Test",
-            related_resource={"type": entity_type, "id": 123}
-        )
-        
-        mcp_result = transformer.to_mcp(copper_task)
-        assert mcp_result.related_to["type"] == entity_type
-        assert mcp_result.related_to["id"] == "123" 
\ No newline at end of file
+    mcp_result = transformer.to_mcp(copper_task)
+    assert mcp_result.related_to["type"] == entity_type
+    assert mcp_result.related_to["id"] == "123" 
\ No newline at end of file
@@ -1,15 +1,29 @@
 """Tests for data transformation between Copper and MCP formats."""
+import os
+
 import pytest
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Literal, Optional
 from pydantic import BaseModel, Field, ValidationError
 
-from app.mapping.transform import BaseTransformer, TransformationError
-from app.models.copper import Person, Company, Opportunity, Activity
-from app.models.mcp import (
-    MCPPerson, MCPCompany, MCPOpportunity, MCPActivity,
-    MCPBase, MCPAttributes
-)
+from app.mapping.transform import BaseTransformer
+from app.models.mcp import MCPBase, MCPAttributes
+
+# Test data
+NOW = datetime(2024, 3, 19, 12, 34, 56, tzinfo=timezone.utc)
+# Minimal valid ComplexTestModel input; tests merge in the fields they vary
+BASE_PAYLOAD = {
+    "id": 0,
+    "required_str": "test",
+    "integer_value": 1,
+    "nested_dict": {},
+    "date_created": NOW,
+    "date_modified": NOW
+}
+FIXED_PAYLOAD = BASE_PAYLOAD | {"id": 1, "integer_value": 42, "nested_dict": {"key": "value"}}
+
+# Benchmarks only run on request: RUN_BENCH=1 pytest tests/test_transform.py
+BENCH = os.environ.get("RUN_BENCH")
 
 class ComplexTestModel(BaseModel):
     """Complex test model with nested data."""
@@ -50,116 +64,153 @@ class ComplexTransformer(BaseTransformer[ComplexTestModel, ComplexMCPModel]):
     
     def transform_list_to_mcp(self, data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Transform a list of data to MCP format."""
-        return [self.to_mcp(item) for item in data_list]
-
-def test_transform_minimal_data():
-    """Test transformation with minimal required data."""
-    transformer = ComplexTransformer()
-    input_data = {
-        "id": 1,
-        "required_str": "test",
-        "integer_value": 1,
-        "nested_dict": {},
-        "date_created": datetime.now(timezone.utc),
-        "date_modified": datetime.now(timezone.utc)
-    }
+        return self.to_mcp_batch(data_list)
+
+class NamedTestModel(BaseModel):
+    """Test model with a name and timestamps."""
+    id: int
+    name: str
+    date_created: datetime
+    date_modified: datetime
+
+class NamedMCPAttributes(MCPAttributes):
+    """Test MCP attributes with an optional value."""
+    value: Optional[str] = None
+
+class NamedMCPModel(MCPBase):
+    """Test MCP model for named records."""
+    type: Literal["test"]
+    attributes: NamedMCPAttributes
+
+class NamedTransformer(BaseTransformer[NamedTestModel, NamedMCPModel]):
+    """Test transformer copying the record name into the attributes."""
     
-    result = transformer.to_mcp(input_data)
+    def _to_mcp_format(self, data: NamedTestModel) -> Dict[str, Any]:
+        """Transform named test data to MCP format."""
+        return {
+            "type": "test",
+            "attributes": {
+                "name": data.name,
+                "value": None
+            }
+        }
+
+class DatedTestModel(BaseModel):
+    """Test model with only an ID and timestamps."""
+    id: int
+    date_created: datetime
+    date_modified: datetime
+
+class DatedMCPModel(MCPBase):
+    """Test MCP model with base attributes."""
+    type: Literal["test"]
+    attributes: MCPAttributes
+
+class DatedTransformer(BaseTransformer[DatedTestModel, DatedMCPModel]):
+    """Test transformer producing empty attributes."""
     
-    assert result["type"] == "complex"
-    assert result["source"] == "copper"
-    assert result["source_id"] == "1"
-    assert result["attributes"]["name"] == "test"
-    assert result["attributes"]["value"] == 1
-    assert result["attributes"]["nested_data"] == {}
-    assert "created_at" in result["attributes"]
-    assert "updated_at" in result["attributes"]
-
-def test_transform_full_data():
-    """Test transformation with all fields populated."""
-    transformer = ComplexTransformer()
-    now = datetime.now(timezone.utc)
-    input_data = {
-        "id": 2,
-        "required_str": "test",
-        "integer_value": 42,
-        "nested_dict": {"key": "value"},
-        "date_created": now,
-        "date_modified": now
-    }
+    def _to_mcp_format(self, data: DatedTestModel) -> Dict[str, Any]:
+        """Transform dated test data to MCP format."""
+        return {
+            "type": "test",
+            "attributes": {}
+        }
+
+class IdTestModel(BaseModel):
+    """Test model with only an ID."""
+    id: int
+
+class DefaultTypeMCPModel(MCPBase):
+    """Test MCP model whose type has a default."""
+    type: str = "test"
+    attributes: MCPAttributes
+
+@pytest.fixture(scope="module")
+def transformer():
+    """Create a complex transformer shared by the module."""
+    return ComplexTransformer()
+
+@pytest.fixture(scope="module")
+def named_transformer():
+    """Create a transformer for named test records."""
+    return NamedTransformer(NamedTestModel, NamedMCPModel)
+
+@pytest.fixture(scope="module")
+def dated_transformer():
+    """Create a transformer for test records with only timestamps."""
+    return DatedTransformer(DatedTestModel, DatedMCPModel)
+
+@pytest.mark.parametrize("delta,expected_name,expected_value,expected_nested", [
+    pytest.param({"id": 1}, "test", 1, {}, id="minimal_data"),
+    pytest.param(
+        {"id": 2, "integer_value": 42, "nested_dict": {"key": "value"}},
+        "test", 42, {"key": "value"},
+        id="full_data"
+    ),
+    pytest.param({"id": 3, "required_str": ""}, "", 1, {}, id="empty_string"),
+    pytest.param(
+        {"id": 4, "required_str": "   spaced   "}, "   spaced   ", 1, {},
+        id="whitespace_string"
+    ),
+    pytest.param(
+        {"id": 8, "nested_dict": {"level1": {"level2": [1, 2, 3], "data": {"a": 1, "b": 2}}}},
+        "test", 1, {"level1": {"level2": [1, 2, 3], "data": {"a": 1, "b": 2}}},
+        id="complex_nested_data"
+    ),
+])
+def test_transform(transformer, delta, expected_name, expected_value, expected_nested):
+    """Test transformation of valid data, varying one aspect per case."""
+    input_data = BASE_PAYLOAD | delta
     
     result = transformer.to_mcp(input_data)
     
     assert result["type"] == "complex"
     assert result["source"] == "copper"
-    assert result["source_id"] == "2"
-    assert result["attributes"]["name"] == "test"
-    assert result["attributes"]["value"] == 42
-    assert result["attributes"]["nested_data"] == {"key": "value"}
-    assert result["attributes"]["created_at"] == now.strftime("%Y-%m-%dT%H:%M:%SZ")
-    assert result["attributes"]["updated_at"] == now.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-def test_transform_empty_string():
-    """Test handling of empty strings."""
-    transformer = ComplexTransformer()
-    now = datetime.now(timezone.utc)
-    input_data = {
-        "id": 3,
-        "required_str": "",  # Empty string
-        "integer_value": 1,
-        "nested_dict": {},
-        "date_created": now,
-        "date_modified": now
-    }
-    
-    result = transformer.to_mcp(input_data)
-    assert result["attributes"]["name"] == ""
-
-def test_transform_whitespace_string():
-    """Test handling of whitespace strings."""
-    transformer = ComplexTransformer()
-    now = datetime.now(timezone.utc)
-    input_data = {
-        "id": 4,
-        "required_str": "   spaced   ",
-        "integer_value": 1,
-        "nested_dict": {},
-        "date_created": now,
-        "date_modified": now
-    }
-    
-    result = transformer.to_mcp(input_data)
-    assert result["attributes"]["name"] == "   spaced   "
+    assert result["source_id"] == str(delta["id"])
+    assert result["attributes"]["name"] == expected_name
+    assert result["attributes"]["value"] == expected_value
+    assert result["attributes"]["nested_data"] == expected_nested
+    assert result["attributes"]["created_at"] == NOW.strftime("%Y-%m-%dT%H:%M:%SZ")
+    assert result["attributes"]["updated_at"] == NOW.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-def test_transform_zero_value():
+def test_transform_zero_value(transformer):
     """Test validation of integer greater than zero."""
-    transformer = ComplexTransformer()
-    now = datetime.now(timezone.utc)
-    input_data = {
-        "id": 5,
-        "required_str": "test",
-        "integer_value": 0,  # Should fail validation
-        "nested_dict": {},
-        "date_created": now,
-        "date_modified": now
-    }
+    input_data = BASE_PAYLOAD | {"id": 5, "integer_value": 0}  # Should fail validation
     
     with pytest.raises(ValidationError) as exc_info:
         transformer.to_mcp(input_data)
-    assert "greater than 0" in str(exc_info.value)
+    assert any(error["type"] == "greater_than" for error in exc_info.value.errors())
 
-def test_transform_empty_list():
+def test_transform_without_validation(transformer):
+    """Test that validate=False builds the Copper model without validating it."""
+    input_data = BASE_PAYLOAD | {"id": 11}
+    assert transformer.to_mcp(input_data, validate=False) == transformer.to_mcp(input_data)
+    
+    # The integer_value > 0 constraint is not checked on this path
+    result = transformer.to_mcp(BASE_PAYLOAD | {"id": 12, "integer_value": 0}, validate=False)
+    assert result["attributes"]["value"] == 0
+
+def test_transform_empty_list(transformer):
     """Test transformation of empty list."""
-    transformer = ComplexTransformer()
     input_data_list: List[Dict[str, Any]] = []
     
     result = transformer.transform_list_to_mcp(input_data_list)
     assert isinstance(result, list)
     assert len(result) == 0
 
-def test_transform_list_with_invalid_item():
+def test_transform_list(transformer):
+    """Test list transformation keeps every item in input order."""
+    input_data_list = [
+        {"id": 9, "required_str": "first", "integer_value": 1, "nested_dict": {}},
+        {"id": 10, "required_str": "second", "integer_value": 2, "nested_dict": {}}
+    ]
+    
+    result = transformer.transform_list_to_mcp(input_data_list)
+    assert [item["source_id"] for item in result] == ["9", "10"]
+    assert result == [transformer.to_mcp(item) for item in input_data_list]
+
+def test_transform_list_with_invalid_item(transformer):
     """Test list transformation with one invalid item."""
-    transformer = ComplexTransformer()
     input_data_list = [
         {"id": 6, "required_str": "valid", "integer_value": 1, "nested_dict": {}},
         {"required_str": "invalid"}  # Missing required fields
@@ -168,163 +219,51 @@ def test_transform_list_with_invalid_item():
     with pytest.raises(ValidationError):
         transformer.transform_list_to_mcp(input_data_list)
 
-def test_transform_nested_empty_dict():
-    """Test handling of empty nested dictionary."""
-    transformer = ComplexTransformer()
-    now = datetime.now(timezone.utc)
-    input_data = {
-        "id": 7,
-        "required_str": "test",
-        "integer_value": 1,
-        "nested_dict": {},
-        "date_created": now,
-        "date_modified": now
-    }
-    
-    result = transformer.to_mcp(input_data)
-    assert result["attributes"]["nested_data"] == {}
-
-def test_transform_complex_nested_data():
-    """Test handling of complex nested data structures."""
-    transformer = ComplexTransformer()
-    now = datetime.now(timezone.utc)
-    input_data = {
-        "id": 8,
-        "required_str": "test",
-        "integer_value": 1,
-        "nested_dict": {
-            "level1": {
-                "level2": [1, 2, 3],
-                "data": {"a": 1, "b": 2}
-            }
-        },
-        "date_created": now,
-        "date_modified": now
-    }
-    
-    result = transformer.to_mcp(input_data)
-    assert result["type"] == "complex"
-    assert result["source"] == "copper"
-    assert result["source_id"] == "8"
-    assert result["attributes"]["name"] == "test"
-    assert result["attributes"]["value"] == 1
-    assert result["attributes"]["nested_data"]["level1"]["level2"] == [1, 2, 3]
-    assert result["attributes"]["nested_data"]["level1"]["data"] == {"a": 1, "b": 2}
-
-def test_base_transformer_validation():
+def test_base_transformer_validation(named_transformer):
     """Test that base transformer properly validates input and output."""
-    class TestModel(BaseModel):
-        id: int
-        name: str
-        date_created: datetime
-        date_modified: datetime
-    
-    class TestMCPAttributes(MCPAttributes):
-        value: Optional[str] = None
-    
-    class TestMCPModel(MCPBase):
-        type: Literal["test"]
-        attributes: TestMCPAttributes
-    
-    class TestTransformer(BaseTransformer[TestModel, TestMCPModel]):
-        def _to_mcp_format(self, data: TestModel) -> Dict[str, Any]:
-            return {
-                "type": "test",
-                "attributes": {
-                    "name": data.name,
-                    "value": None
-                }
-            }
-    
-    transformer = TestTransformer(TestModel, TestMCPModel)
-    
     # Test with valid data
-    now = datetime.now(timezone.utc)
-    result = transformer.to_mcp({
+    result = named_transformer.to_mcp({
         "id": 123,
         "name": "Test",
-        "date_created": now,
-        "date_modified": now
+        "date_created": NOW,
+        "date_modified": NOW
     })
     
     assert result["type"] == "test"
     assert result["source"] == "copper"
     assert result["source_id"] == "123"
-    assert result["attributes"]["created_at"] == now.strftime("%Y-%m-%dT%H:%M:%SZ")
-    assert result["attributes"]["updated_at"] == now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    assert result["attributes"]["created_at"] == NOW.strftime("%Y-%m-%dT%H:%M:%SZ")
+    assert result["attributes"]["updated_at"] == NOW.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-def test_relationship_creation():
+def test_relationship_creation(dated_transformer):
     """Test creation of MCP relationships."""
-    class TestModel(BaseModel):
-        id: int
-        date_created: datetime
-        date_modified: datetime
-    
-    class TestMCPModel(MCPBase):
-        type: Literal["test"]
-        attributes: MCPAttributes
-    
-    class TestTransformer(BaseTransformer[TestModel, TestMCPModel]):
-        def _to_mcp_format(self, data: TestModel) -> Dict[str, Any]:
-            return {
-                "type": "test",
-                "attributes": {}
-            }
-    
-    transformer = TestTransformer(TestModel, TestMCPModel)
-    
     # Test with valid relationship
-    rel = transformer._create_relationship("user", 123, "Test User")
+    rel = dated_transformer._create_relationship("user", 123, "Test User")
     assert rel["data"]["type"] == "user"
     assert rel["data"]["id"] == "123"
     assert rel["data"]["name"] == "Test User"
     
     # Test with missing ID
-    rel = transformer._create_relationship("user", None)
+    rel = dated_transformer._create_relationship("user", None)
     assert rel["data"] is None
     
     # Test without name
-    rel = transformer._create_relationship("user", 123)
+    rel = dated_transformer._create_relationship("user", 123)
     assert rel["data"]["type"] == "user"
     assert rel["data"]["id"] == "123"
     assert "name" not in rel["data"]
 
-def test_datetime_formatting():
+def test_datetime_formatting(dated_transformer):
     """Test datetime formatting to ISO8601."""
-    class TestModel(BaseModel):
-        id: int
-        date_created: datetime
-        date_modified: datetime
-    
-    class TestMCPModel(MCPBase):
-        type: Literal["test"]
-        attributes: MCPAttributes
-    
-    class TestTransformer(BaseTransformer[TestModel, TestMCPModel]):
-        def _to_mcp_format(self, data: TestModel) -> Dict[str, Any]:
-            return {
-                "type": "test",
-                "attributes": {}
-            }
-    
-    transformer = TestTransformer(TestModel, TestMCPModel)
-    
     dt = datetime(2024, 3, 19, 12, 34, 56, tzinfo=timezone.utc)
-    formatted = transformer._format_datetime(dt)
+    formatted = dated_transformer._format_datetime(dt)
     assert formatted == "2024-03-19T12:34:56Z"
     
-    assert transformer._format_datetime(None) is None
+    assert dated_transformer._format_datetime(None) is None
 
 def test_primary_contact_extraction():
     """Test extraction of primary contact methods."""
-    class TestModel(BaseModel):
-        id: int
-    
-    class TestMCPModel(MCPBase):
-        type: str = "test"
-        attributes: MCPAttributes
-    
-    transformer = BaseTransformer(TestModel, TestMCPModel)
+    transformer = BaseTransformer(IdTestModel, DefaultTypeMCPModel)
     
     contacts = [
         {"category": "work", "type": "phone", "value": "123-work"},
@@ -344,39 +283,13 @@ def test_primary_contact_extraction():
     # Test empty contacts
     assert transformer._get_primary_contact([]) is None
 
-def test_mcp_format_compliance():
+def test_mcp_format_compliance(named_transformer):
     """Test that transformed data complies with MCP format."""
-    class TestModel(BaseModel):
-        id: int
-        name: str
-        date_created: datetime
-        date_modified: datetime
-    
-    class TestMCPAttributes(MCPAttributes):
-        value: Optional[str] = None
-    
-    class TestMCPModel(MCPBase):
-        type: Literal["test"]
-        attributes: TestMCPAttributes
-    
-    class TestTransformer(BaseTransformer[TestModel, TestMCPModel]):
-        def _to_mcp_format(self, data: TestModel) -> Dict[str, Any]:
-            return {
-                "type": "test",
-                "attributes": {
-                    "name": data.name,
-                    "value": None
-                }
-            }
-    
-    transformer = TestTransformer(TestModel, TestMCPModel)
-    now = datetime.now(timezone.utc)
-    
-    result = transformer.to_mcp({
+    result = named_transformer.to_mcp({
         "id": 123,
         "name": "Test",
-        "date_created": now,
-        "date_modified": now
+        "date_created": NOW,
+        "date_modified": NOW
     })
     
     # Verify MCP format compliance
@@ -395,5 +308,20 @@ def test_mcp_format_compliance():
     assert result["source_id"] == "123"
     
     # Verify timestamps
-    assert result["attributes"]["created_at"] == now.strftime("%Y-%m-%dT%H:%M:%SZ")
-    assert result["attributes"]["updated_at"] == now.strftime("%Y-%m-%dT%H:%M:%SZ") 
\ No newline at end of file
+    assert result["attributes"]["created_at"] == NOW.strftime("%Y-%m-%dT%H:%M:%SZ")
+    assert result["attributes"]["updated_at"] == NOW.strftime("%Y-%m-%dT%H:%M:%SZ") 
+
+@pytest.mark.skipif(not BENCH, reason="set RUN_BENCH=1 to run benchmarks")
+@pytest.mark.benchmark(group="transform")
+def test_to_mcp_perf(benchmark, transformer):
+    """Benchmark transforming a single record."""
+    result = benchmark(transformer.to_mcp, FIXED_PAYLOAD)
+    assert result["source_id"] == "1"
+
+@pytest.mark.skipif(not BENCH, reason="set RUN_BENCH=1 to run benchmarks")
+@pytest.mark.benchmark(group="transform")
+def test_to_mcp_batch_perf(benchmark, transformer):
+    """Benchmark transforming a batch of 1000 records."""
+    batch = [FIXED_PAYLOAD] * 1000
+    result = benchmark(transformer.to_mcp_batch, batch)
+    assert len(result) == 1000